@@ -2,10 +2,11 @@
 Classe principal da aplicação de análise de vendas.
 """
 
+from itertools import chain
 from logging import getLogger
-from typing import List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from sales_report.interfaces.data_filter import DataFilter
+from sales_report.interfaces.data_filter import DataFilter, RowPredicate
 from sales_report.interfaces.data_processor import DataProcessor
 from sales_report.interfaces.data_reader import DataReader
 from sales_report.interfaces.data_validator import DataValidator
@@ -15,22 +16,27 @@ from sales_report.validators.sales_validator import SalesDataValidator
 
 logger = getLogger(__name__)
 
+# Registro acompanhado do número da sua linha de origem nos dados lidos.
+NumberedRow = Tuple[int, Dict[str, str]]
+
 
 class SalesAnalyzerApp:
     """
     Classe principal da aplicação de análise de vendas.
-    Orquestra o fluxo de leitura, validação, filtragem, processamento
+    Orquestra o fluxo de leitura, filtragem, validação, processamento
     e formatação dos dados de vendas. Segue o princípio da inversão
     de dependência, dependendo apenas de abstrações.
     """
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         data_reader: DataReader,
         data_processor: DataProcessor,
         output_formatter: OutputFormatter,
         data_validator: Optional[DataValidator] = None,
         data_filters: Optional[List[DataFilter]] = None,
+        *,
+        schema_info: Optional[Dict[str, Any]] = None,
     ) -> None:
         """
         Inicializa a aplicação com suas dependências.
@@ -41,12 +47,16 @@ class SalesAnalyzerApp:
             output_formatter (OutputFormatter): Formatador de saída.
             data_validator (Optional[DataValidator]): Validador de dados.
             data_filters (Optional[List[DataFilter]]): Lista de filtros.
+            schema_info (Optional[Dict[str, Any]]): Schema conhecido dos
+                dados, no formato de ``SchemaDetector.detect_schema``. Se
+                None, o schema é detectado a partir do primeiro registro.
         """
         self.data_reader = data_reader
         self.data_processor = data_processor
         self.output_formatter = output_formatter
         self.data_validator = data_validator
         self.data_filters = data_filters or []
+        self.schema_info = schema_info
 
     def run(self) -> str:  # noqa: PLR0912
         """
@@ -55,19 +65,21 @@ class SalesAnalyzerApp:
         Returns:
             str: Resultado formatado da análise de vendas.
         """
-        # 1. Ler dados
+        # 1. Ler dados. Os registros são consumidos sob demanda; o schema é
+        # detectado a partir do primeiro registro, reinserido no fluxo.
         logger.debug('Iniciando leitura dos dados')
-        raw_data = self.data_reader.read()
+        rows = iter(self.data_reader.read())
+        first_row = next(rows, None)
 
-        if not raw_data:
+        if first_row is None:
             logger.error('Nenhum dado foi lido')
             return 'Erro: Nenhum dado disponível para processar.'
 
-        logger.debug(f'Lidos {len(raw_data)} registros')
-
-        # 1.5. Detectar schema dos dados
-        logger.debug('Detectando schema dos dados')
-        schema_info = SchemaDetector.detect_schema(raw_data)
+        # 1.5. Detectar schema dos dados (se não fornecido)
+        schema_info = self.schema_info
+        if schema_info is None:
+            logger.debug('Detectando schema dos dados')
+            schema_info = SchemaDetector.detect_schema([first_row])
 
         if not schema_info['is_valid_sales_data']:
             logger.error('Dados não possuem estrutura válida para vendas')
@@ -76,7 +88,22 @@ class SalesAnalyzerApp:
                 '(produto, quantidade, preco_unitario).'
             )
 
-        # 2. Validar dados (se validador fornecido)
+        # 2. Aplicar filtros (apenas filtros de data que são aplicáveis).
+        # Os filtros rodam antes da validação para que apenas os registros
+        # selecionados sejam validados; cada registro leva consigo o número
+        # da linha de origem, usado nas mensagens do validador.
+        numbered_rows = enumerate(chain([first_row], rows), start=1)
+        filtered = self._apply_filters(numbered_rows, schema_info)
+        first_numbered = next(filtered, None)
+
+        if first_numbered is None:
+            logger.warning('Nenhum dado restou após aplicação dos filtros')
+            return 'Nenhum dado encontrado após aplicação dos filtros.'
+
+        numbered: Iterable[NumberedRow] = chain([first_numbered], filtered)
+        data: Iterable[Dict[str, str]]
+
+        # 3. Validar dados (se validador fornecido)
         if self.data_validator:
             logger.debug('Validando dados')
 
@@ -85,7 +112,12 @@ class SalesAnalyzerApp:
                     schema_info=schema_info
                 )
 
-            valid_data, errors = self.data_validator.validate(raw_data)
+            # O validador consome os registros filtrados no mesmo fluxo,
+            # retendo apenas os válidos. Datas em formato inválido já foram
+            # descartadas (com aviso) por filtros de data configurados.
+            valid_data, errors = self.data_validator.validate_numbered(
+                numbered
+            )
 
             if errors:
                 for error in errors:
@@ -95,43 +127,10 @@ class SalesAnalyzerApp:
                 logger.error('Nenhum dado válido encontrado')
                 return 'Erro: Nenhum dado válido encontrado após validação.'
 
-            logger.debug(
-                f'{len(valid_data)} registros válidos de {
-                    len(raw_data)
-                } totais'
-            )
+            logger.debug(f'{len(valid_data)} registros válidos')
             data = valid_data
         else:
-            data = raw_data
-
-        # 3. Aplicar filtros (apenas filtros de data que são aplicáveis)
-        applicable_filters = []
-        for data_filter in self.data_filters:
-            if hasattr(data_filter, 'date_column'):
-                if schema_info['has_date_column']:
-                    if hasattr(data_filter, 'date_column'):
-                        setattr(
-                            data_filter,
-                            'date_column',
-                            schema_info['date_column'],
-                        )
-                    applicable_filters.append(data_filter)
-                else:
-                    logger.info(
-                        'Filtro de data ignorado: dados não tem coluna de data'
-                    )
-            else:
-                applicable_filters.append(data_filter)
-
-        for data_filter in applicable_filters:
-            logger.info(f'Aplicando filtro: {type(data_filter).__name__}')
-            data = data_filter.filter(data)
-
-        if not data:
-            logger.warning('Nenhum dado restou após aplicação dos filtros')
-            return 'Nenhum dado encontrado após aplicação dos filtros.'
-
-        logger.debug(f'{len(data)} registros após filtragem')
+            data = (row for _, row in numbered)
 
         # 4. Processar dados
         logger.info('Processando dados')
@@ -143,3 +142,98 @@ class SalesAnalyzerApp:
 
         logger.info('Processamento concluído com sucesso \n')
         return result
+
+    def _apply_filters(
+        self, data: Iterator[NumberedRow], schema_info: Dict[str, Any]
+    ) -> Iterator[NumberedRow]:
+        """
+        Aplica aos dados os filtros compatíveis com o schema detectado.
+
+        Cada filtro decide, via ``configure``, se é aplicável ao schema
+        (filtros de data exigem coluna de data). Sem filtros configurados,
+        os dados são devolvidos sem nenhuma passada adicional. Filtros com
+        predicado por registro são avaliados sob demanda; os demais recebem
+        os registros em lista.
+
+        Args:
+            data (Iterator[NumberedRow]): Registros a filtrar, numerados
+                pela linha de origem.
+            schema_info (Dict[str, Any]): Informações do schema detectado.
+
+        Returns:
+            Iterator[NumberedRow]: Registros que passaram pelos filtros,
+                com a numeração original preservada.
+        """
+        if not self.data_filters:
+            return data
+
+        applicable_filters = [
+            data_filter
+            for data_filter in self.data_filters
+            if data_filter.configure(schema_info)
+        ]
+
+        # Predicados consecutivos são combinados e avaliados em uma única
+        # passada; antes de um filtro que usa ``filter``, os predicados
+        # pendentes são aplicados para preservar a ordem configurada.
+        predicates: List[RowPredicate] = []
+        for data_filter in applicable_filters:
+            logger.info(f'Aplicando filtro: {type(data_filter).__name__}')
+            predicate = data_filter.row_predicate()
+            if predicate is None:
+                if predicates:
+                    data = self._apply_predicates(data, predicates)
+                    predicates = []
+                data = self._apply_list_filter(data_filter, data)
+            else:
+                predicates.append(predicate)
+
+        if predicates:
+            data = self._apply_predicates(data, predicates)
+
+        return data
+
+    @staticmethod
+    def _apply_list_filter(
+        data_filter: DataFilter, data: Iterator[NumberedRow]
+    ) -> Iterator[NumberedRow]:
+        """
+        Aplica um filtro baseado em lista preservando a numeração original.
+
+        Registros devolvidos pelo filtro recuperam o número da linha de
+        origem; registros criados pelo próprio filtro, sem linha de origem,
+        são numerados pela posição no resultado.
+
+        Args:
+            data_filter (DataFilter): Filtro sem predicado por registro.
+            data (Iterator[NumberedRow]): Registros a filtrar.
+
+        Returns:
+            Iterator[NumberedRow]: Registros mantidos pelo filtro.
+        """
+        numbered = list(data)
+        line_numbers = {id(row): number for number, row in numbered}
+        kept = data_filter.filter([row for _, row in numbered])
+        return (
+            (line_numbers.get(id(row), position), row)
+            for position, row in enumerate(kept, start=1)
+        )
+
+    @staticmethod
+    def _apply_predicates(
+        data: Iterator[NumberedRow], predicates: List[RowPredicate]
+    ) -> Iterator[NumberedRow]:
+        """
+        Mantém, sob demanda, os registros que satisfazem todos os predicados.
+
+        Args:
+            data (Iterator[NumberedRow]): Registros a filtrar.
+            predicates (List[RowPredicate]): Predicados dos filtros.
+
+        Returns:
+            Iterator[NumberedRow]: Registros aceitos por todos os filtros.
+        """
+        if len(predicates) == 1:
+            predicate = predicates[0]
+            return (item for item in data if predicate(item[1]))
+        return (item for item in data if all(p(item[1]) for p in predicates))
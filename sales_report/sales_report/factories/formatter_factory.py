@@ -14,7 +14,8 @@ class FormatterFactory:
     Factory responsável por criar instâncias de formatadores.
 
     Implementa o padrão Factory para desacoplar a criação
-    de formatadores do código cliente.
+    de formatadores do código cliente. Como os formatadores não
+    guardam estado, cada tipo é instanciado uma única vez e reutilizado.
     """
 
     _formatters: Dict[str, Type[OutputFormatter]] = {
@@ -22,6 +23,8 @@ class FormatterFactory:
         'json': JSONFormatter,
     }
 
+    _instances: Dict[str, OutputFormatter] = {}
+
     @classmethod
     def create_formatter(cls, format_type: str) -> OutputFormatter:
         """
@@ -36,14 +39,37 @@ class FormatterFactory:
         Raises:
             ValueError: Se o tipo de formatador não for suportado.
         """
-        if format_type not in cls._formatters:
+        formatter = cls._instances.get(format_type)
+        if formatter is not None:
+            return formatter
+
+        formatter_class = cls._formatters.get(format_type)
+        if formatter_class is None:
             available = ', '.join(cls._formatters.keys())
             raise ValueError(
                 f'Formatador "{format_type}" não suportado. '
                 f'Disponíveis: {available}'
             )
 
-        return cls._formatters[format_type]()
+        formatter = cls._instances[format_type] = formatter_class()
+        return formatter
+
+    @classmethod
+    def register(
+        cls, format_type: str, formatter_class: Type[OutputFormatter]
+    ) -> None:
+        """
+        Registra um formatador para o tipo especificado.
+
+        Permite adicionar novos formatos sem modificar a factory. Se o
+        tipo já existir, o formatador anterior é substituído.
+
+        Args:
+            format_type (str): Nome do formato (ex.: 'csv').
+            formatter_class (Type[OutputFormatter]): Classe do formatador.
+        """
+        cls._formatters[format_type] = formatter_class
+        cls._instances.pop(format_type, None)
 
     @classmethod
     def get_available_formats(cls) -> list[str]:
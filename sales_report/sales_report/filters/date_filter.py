@@ -4,9 +4,10 @@ Implementação de filtros baseados em data.
 
 from datetime import datetime
 from logging import getLogger
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-from sales_report.interfaces.data_filter import DataFilter
+from sales_report.interfaces.data_filter import DataFilter, RowPredicate
+from sales_report.utils.date_utils import DateUtils
 
 logger = getLogger(__name__)
 
@@ -37,6 +38,31 @@ class DateFilter(DataFilter):
         self.end_date = end_date
         self.date_column = date_column
 
+    def configure(self, schema_info: Dict[str, Any]) -> bool:
+        """
+        Associa o filtro à coluna de data detectada no schema.
+
+        Args:
+            schema_info (Dict[str, Any]): Informações do schema detectado.
+
+        Returns:
+            bool: True se os dados possuem coluna de data e ao menos uma
+                data limite foi informada; caso contrário o filtro é
+                ignorado.
+        """
+        if not schema_info['has_date_column']:
+            logger.info(
+                'Filtro de data ignorado: dados não tem coluna de data'
+            )
+            return False
+
+        if not self.start_date and not self.end_date:
+            logger.debug('Filtro de data ignorado: nenhuma data limite')
+            return False
+
+        self.date_column = schema_info['date_column']
+        return True
+
     def filter(self, data: List[Dict[str, str]]) -> List[Dict[str, str]]:
         """
         Aplica o filtro de data aos dados.
@@ -48,7 +74,8 @@ class DateFilter(DataFilter):
             List[Dict[str, str]]: Lista de registros que estão dentro
                 do intervalo de datas especificado.
         """
-        if not self.start_date and not self.end_date:
+        predicate = self.row_predicate()
+        if predicate is None:
             return data
 
         if not data or self.date_column not in data[0]:
@@ -58,63 +85,67 @@ class DateFilter(DataFilter):
             )
             return data
 
-        filtered_data: List[Dict[str, str]] = []
+        return [row for row in data if predicate(row)]
+
+    def row_predicate(self) -> Optional[RowPredicate]:
+        """
+        Retorna o predicado por registro do filtro de data.
+
+        Registros sem data são mantidos; registros com data inválida são
+        descartados com um aviso por valor distinto. Retorna None quando
+        nenhuma data limite foi especificada.
+
+        Returns:
+            Optional[RowPredicate]: Predicado do intervalo de datas.
+        """
+        if not self.start_date and not self.end_date:
+            return None
+
+        start, end = self._date_bounds()
+        date_column = self.date_column
+
+        # A decisão é memorizada por string de data: como vendas repetem
+        # poucas datas distintas, cada valor é convertido, comparado e, se
+        # inválido, reportado uma única vez por passada.
+        decisions: Dict[str, bool] = {}
 
-        for row in data:
-            date_str = row.get(self.date_column, '').strip()
+        def predicate(row: Dict[str, str]) -> bool:
+            date_str = row.get(date_column, '').strip()
 
             if not date_str:
-                logger.debug(
-                    'Linha sem data encontrada, incluindo no resultado'
-                )
-                filtered_data.append(row)
-                continue
+                return True
+
+            keep = decisions.get(date_str)
+            if keep is not None:
+                return keep
 
-            date_obj = self._parse_date(date_str)
+            date_obj = DateUtils.parse_iso_date(date_str)
 
             if date_obj is None:
                 logger.warning(
-                    f'Data ignorada por formato inválido: {date_str}'
+                    f'Data ignorada por formato inválido: "{date_str}". '
+                    'Esperado YYYY-MM-DD.'
                 )
-                continue
-
-            if self._is_date_in_range(date_obj):
-                filtered_data.append(row)
-
-        return filtered_data
-
-    @staticmethod
-    def _parse_date(date_str: str) -> Optional[datetime]:
-        """
-        Converte uma string de data no formato YYYY-MM-DD para datetime.
+                keep = False
+            else:
+                keep = start <= date_obj <= end
 
-        Args:
-            date_str (str): String da data no formato YYYY-MM-DD.
+            decisions[date_str] = keep
+            return keep
 
-        Returns:
-            Optional[datetime]: Objeto datetime se a conversão estiver OK,
-                None caso contrário.
-        """
-        try:
-            return datetime.strptime(date_str, '%Y-%m-%d')
-        except ValueError as e:
-            logger.error(
-                f'Data inválida: "{date_str}". Esperado YYYY-MM-DD. Erro: {e}'
-            )
-            return None
+        return predicate
 
-    def _is_date_in_range(self, date_obj: datetime) -> bool:
+    def _date_bounds(self) -> Tuple[datetime, datetime]:
         """
-        Verifica se a data está dentro do intervalo especificado.
+        Retorna os limites do intervalo, substituindo os ausentes.
 
-        Args:
-            date_obj (datetime): Data a ser verificada.
+        Limites não informados viram ``datetime.min``/``datetime.max``,
+        permitindo testar cada data com uma única comparação encadeada.
 
         Returns:
-            bool: True se a data estiver no intervalo, False caso contrário.
+            Tuple[datetime, datetime]: Data inicial e data final.
         """
-        if self.start_date and date_obj < self.start_date:
-            return False
-        if self.end_date and date_obj > self.end_date:
-            return False
-        return True
+        return (
+            self.start_date or datetime.min,
+            self.end_date or datetime.max,
+        )
@@ -2,9 +2,7 @@
 Implementação do formatador de texto.
 """
 
-from typing import Any, Dict
-
-from tabulate import tabulate
+from typing import Any, Dict, List
 
 from sales_report.interfaces.output_formatter import OutputFormatter
 
@@ -17,6 +15,12 @@ class TextFormatter(OutputFormatter):
     de texto usando tabelas para melhor visualização.
     """
 
+    # Cabeçalhos da tabela de vendas por produto
+    HEADERS = ('Produto', 'Total (R$)')
+
+    # Espaço mínimo entre o cabeçalho e a borda da coluna
+    HEADER_PADDING = 2
+
     @staticmethod
     def format(data: Dict[str, Any]) -> str:
         """
@@ -34,11 +38,7 @@ class TextFormatter(OutputFormatter):
         lines = []
 
         lines.append('Total de vendas por produto:')
-        table_data = list(data['vendas_por_produto'].items())
-        table = tabulate(
-            table_data, headers=['Produto', 'Total (R$)'], floatfmt='.2f'
-        )
-        lines.append(table)
+        lines.extend(TextFormatter._format_table(data['vendas_por_produto']))
 
         lines.append(
             f'\nValor total de todas as vendas: R$ {data["total_vendas"]:.2f}'
@@ -52,3 +52,44 @@ class TextFormatter(OutputFormatter):
             )
 
         return '\n'.join(lines)
+
+    @staticmethod
+    def _format_table(sales_by_product: Dict[str, float]) -> List[str]:
+        """
+        Monta as linhas da tabela de vendas por produto.
+
+        A tabela tem sempre duas colunas, então as larguras são calculadas
+        diretamente, no layout do formato ``simple`` do tabulate para nomes
+        textuais: produtos alinhados à esquerda (sem espaços nas bordas) e
+        totais à direita, com duas casas. Diferente do tabulate, nomes que
+        parecem números (códigos como ``123`` ou ``nan``) continuam sendo
+        tratados como texto e alinhados à esquerda.
+
+        Args:
+            sales_by_product (Dict[str, float]): Total de vendas por produto.
+
+        Returns:
+            List[str]: Cabeçalho, linha separadora e uma linha por produto.
+        """
+        name_header, total_header = TextFormatter.HEADERS
+        names = [name.strip() for name in sales_by_product]
+        totals = [f'{total:.2f}' for total in sales_by_product.values()]
+
+        name_width = max(
+            len(name_header) + TextFormatter.HEADER_PADDING,
+            *map(len, names),
+        )
+        total_width = max(
+            len(total_header) + TextFormatter.HEADER_PADDING,
+            *map(len, totals),
+        )
+
+        lines = [
+            f'{name_header:<{name_width}}  {total_header:>{total_width}}',
+            f'{"-" * name_width}  {"-" * total_width}',
+        ]
+        lines.extend(
+            f'{name:<{name_width}}  {total:>{total_width}}'
+            for name, total in zip(names, totals)
+        )
+        return lines
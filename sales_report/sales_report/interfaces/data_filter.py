@@ -3,7 +3,9 @@ Interfaces para filtros de dados.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Any, Callable, Dict, List, Optional
+
+RowPredicate = Callable[[Dict[str, str]], bool]
 
 
 class DataFilter(ABC):
@@ -26,3 +28,33 @@ class DataFilter(ABC):
             List[Dict[str, str]]: Lista de registros filtrados.
         """
         pass  # pragma: no cover
+
+    def configure(self, schema_info: Dict[str, Any]) -> bool:  # noqa: PLR6301
+        """
+        Ajusta o filtro ao schema detectado nos dados.
+
+        Chamado uma vez por execução, antes da filtragem. A implementação
+        padrão não depende do schema e considera o filtro sempre aplicável.
+
+        Args:
+            schema_info (Dict[str, Any]): Informações do schema detectado.
+
+        Returns:
+            bool: True se o filtro deve ser aplicado aos dados.
+        """
+        return True
+
+    def row_predicate(self) -> Optional[RowPredicate]:  # noqa: PLR6301
+        """
+        Retorna um predicado por registro equivalente ao filtro.
+
+        Permite que vários filtros sejam combinados e avaliados em uma
+        única passada sobre os dados, sem listas intermediárias. A
+        implementação padrão retorna None, indicando que o filtro só pode
+        ser aplicado via ``filter``.
+
+        Returns:
+            Optional[RowPredicate]: Função que recebe um registro e
+                retorna True se ele deve ser mantido, ou None.
+        """
+        return None
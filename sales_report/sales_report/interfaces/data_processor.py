@@ -3,7 +3,7 @@ Interfaces para processamento de dados.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable
 
 
 class DataProcessor(ABC):
@@ -15,12 +15,13 @@ class DataProcessor(ABC):
     """
 
     @abstractmethod
-    def process(self, data: List[Dict[str, str]]) -> Dict[str, Any]:
+    def process(self, data: Iterable[Dict[str, str]]) -> Dict[str, Any]:
         """
         Processa os dados e retorna estatísticas.
 
         Args:
-            data (List[Dict[str, str]]): Lista de registros de dados.
+            data (Iterable[Dict[str, str]]): Registros de dados, que podem
+                ser consumidos sob demanda em uma única passada.
 
         Returns:
             Dict[str, Any]: Dicionário com as estatísticas processadas.
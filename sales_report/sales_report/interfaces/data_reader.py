@@ -3,7 +3,7 @@ Interfaces para leitura de dados.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List
+from typing import Dict, Iterable
 
 
 class DataReader(ABC):
@@ -15,12 +15,15 @@ class DataReader(ABC):
     """
 
     @abstractmethod
-    def read(self) -> List[Dict[str, str]]:
+    def read(self) -> Iterable[Dict[str, str]]:
         """
-        Lê os dados da fonte e retorna uma lista de dicionários.
+        Lê os dados da fonte e retorna os registros como dicionários.
+
+        Implementações podem produzir os registros sob demanda (por
+        exemplo, um gerador); o resultado deve ser percorrido uma única vez.
 
         Returns:
-            List[Dict[str, str]]: Lista de registros onde cada registro
+            Iterable[Dict[str, str]]: Registros onde cada registro
                 é um dicionário com os dados.
         """
         pass  # pragma: no cover
@@ -3,7 +3,7 @@ Interfaces para validação de dados.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Tuple
 
 
 class DataValidator(ABC):
@@ -15,16 +15,37 @@ class DataValidator(ABC):
 
     @abstractmethod
     def validate(
-        self, data: List[Dict[str, str]]
+        self, data: Iterable[Dict[str, str]]
     ) -> Tuple[List[Dict[str, str]], List[str]]:
         """
         Valida os dados e retorna dados válidos e erros encontrados.
 
         Args:
-            data (List[Dict[str, str]]): Lista de registros a serem validados.
+            data (Iterable[Dict[str, str]]): Registros a serem validados,
+                percorridos uma única vez.
 
         Returns:
             Tuple[List[Dict[str, str]], List[str]]: Tupla contendo
                 lista de registros válidos e lista de mensagens de erro.
         """
         pass  # pragma: no cover
+
+    def validate_numbered(
+        self, numbered_rows: Iterable[Tuple[int, Dict[str, str]]]
+    ) -> Tuple[List[Dict[str, str]], List[str]]:
+        """
+        Valida registros acompanhados do número da linha de origem.
+
+        A implementação padrão descarta os números e delega a ``validate``;
+        validadores que reportam linhas devem sobrescrevê-la para usar a
+        numeração original dos dados.
+
+        Args:
+            numbered_rows (Iterable[Tuple[int, Dict[str, str]]]): Pares
+                (número da linha, registro), percorridos uma única vez.
+
+        Returns:
+            Tuple[List[Dict[str, str]], List[str]]: Tupla contendo
+                lista de registros válidos e lista de mensagens de erro.
+        """
+        return self.validate(row for _, row in numbered_rows)
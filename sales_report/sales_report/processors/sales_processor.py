@@ -2,9 +2,8 @@
 Implementação do processador de dados de vendas.
 """
 
-from collections import defaultdict
 from logging import getLogger
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List
 
 from sales_report.interfaces.data_processor import DataProcessor
 
@@ -19,16 +18,18 @@ class SalesDataProcessor(DataProcessor):
     e calcular estatísticas relevantes.
     """
 
-    def process(self, data: List[Dict[str, str]]) -> Dict[str, Any]:
+    def process(self, data: Iterable[Dict[str, str]]) -> Dict[str, Any]:
         """
         Processa os dados de vendas e calcula estatísticas.
 
         Args:
-            data (List[Dict[str, str]]): Lista de registros de vendas válidos.
+            data (Iterable[Dict[str, str]]): Registros de vendas válidos,
+                percorridos uma única vez.
 
         Returns:
             Dict[str, Any]: Dicionário com estatísticas de vendas incluindo:
-                - vendas_por_produto: Total de vendas por produto
+                - vendas_por_produto: Total de vendas por produto, em ordem
+                  decrescente de valor
                 - total_vendas: Valor total de todas as vendas
                 - produto_mais_vendido: Produto com maior quantidade vendida
         """
@@ -36,8 +37,9 @@ class SalesDataProcessor(DataProcessor):
             logger.warning('Nenhum dado fornecido para processamento')
             return self._empty_result()
 
-        sales_by_product: Dict[str, float] = defaultdict(float)
-        quantity_by_product: Dict[str, int] = defaultdict(int)
+        # Um único acumulador [valor, quantidade] por produto: uma busca
+        # no dicionário por linha em vez de quatro.
+        totals_by_product: Dict[str, List[Any]] = {}
         total_sales: float = 0.0
 
         for row in data:
@@ -45,32 +47,47 @@ class SalesDataProcessor(DataProcessor):
                 product = row['produto']
                 quantity = int(row['quantidade'])
                 price = float(row['preco_unitario'])
-
-                value = quantity * price
-                sales_by_product[product] += value
-                quantity_by_product[product] += quantity
-                total_sales += value
-
             except (KeyError, ValueError) as e:
                 logger.error(f'Erro ao processar linha: {e}')
                 continue
 
-        if not quantity_by_product:
+            value = quantity * price
+            total_sales += value
+
+            totals = totals_by_product.get(product)
+            if totals is None:
+                totals = totals_by_product[product] = [value, quantity]
+            else:
+                totals[0] += value
+                totals[1] += quantity
+
+        if not totals_by_product:
             logger.warning(
                 'Nenhuma venda válida encontrada após processamento'
             )
             return self._empty_result()
 
-        top_product = max(
-            quantity_by_product.items(), key=lambda x: x[1], default=('', 0)
-        )[0]
+        # Produto mais vendido pela quantidade total, apurada depois da
+        # agregação (quantidades podem ser nulas ou negativas sem
+        # validação); em caso de empate, vale o primeiro produto lido.
+        top_product, (_, top_quantity) = max(
+            totals_by_product.items(), key=lambda x: x[1][1]
+        )
+
+        # Ordenado uma única vez aqui, para que os formatadores apenas
+        # percorram o resultado em sequência.
+        ranked = sorted(
+            totals_by_product.items(), key=lambda x: x[1][0], reverse=True
+        )
 
         return {
-            'vendas_por_produto': dict(sales_by_product),
+            'vendas_por_produto': {
+                product: totals[0] for product, totals in ranked
+            },
             'total_vendas': total_sales,
             'produto_mais_vendido': {
                 'nome': top_product,
-                'quantidade': quantity_by_product.get(top_product, 0),
+                'quantidade': top_quantity,
             },
         }
 
@@ -2,21 +2,36 @@
 Implementação do leitor de arquivos CSV.
 """
 
-from csv import DictReader
+from csv import reader
 from logging import getLogger
-from typing import Dict, List
+from typing import Dict, Iterable, Iterator
 
 from sales_report.interfaces.data_reader import DataReader
 
 logger = getLogger(__name__)
 
+# Buffer de leitura de 1 MiB: reduz o número de chamadas read() em
+# arquivos grandes em relação ao padrão de 8 KiB.
+READ_BUFFER_SIZE = 1 << 20
+
+
+class CSVReadError(Exception):
+    """
+    Erro de leitura ocorrido depois que registros já foram entregues.
+
+    Como a leitura é sob demanda, uma falha no meio do arquivo não pode
+    ser tratada como arquivo vazio: os registros anteriores já foram
+    consumidos e o resultado ficaria truncado.
+    """
+
 
 class CSVReader(DataReader):
     """
     Implementação concreta do leitor de dados para arquivos CSV.
 
     Responsável exclusivamente por ler arquivos CSV com tratamento
-    de diferentes encodings.
+    de diferentes encodings. Os registros são produzidos sob demanda,
+    sem materializar o arquivo inteiro em memória.
     """
 
     def __init__(self, file_path: str) -> None:
@@ -28,34 +43,109 @@ class CSVReader(DataReader):
         """
         self.file_path: str = file_path
 
-    def read(self) -> List[Dict[str, str]]:
+    def read(self) -> Iterator[Dict[str, str]]:
         """
-        Lê o arquivo CSV e retorna uma lista de dicionários.
+        Lê o arquivo CSV sob demanda, um registro por vez.
 
-        Tenta ler o arquivo usando encoding UTF-8 primeiro, e em caso de erro,
-        faz fallback para CP1252. Trata erros de arquivo não encontrado e
-        outros erros de leitura.
+        O encoding é escolhido antes do primeiro registro: UTF-8 se o
+        arquivo inteiro for decodificável, CP1252 caso contrário. Assim
+        todas as linhas são decodificadas da mesma forma. Trata erros de
+        arquivo não encontrado e outros erros de leitura.
 
         Returns:
-            List[Dict[str, str]]: Lista de dicionários onde cada dicionário
-                representa uma linha do CSV com as colunas como chaves.
-                Retorna lista vazia em caso de erro.
+            Iterator[Dict[str, str]]: Iterador de dicionários onde cada
+                dicionário representa uma linha do CSV com as colunas como
+                chaves. Não produz registros se o erro ocorrer antes do
+                primeiro registro.
+
+        Raises:
+            CSVReadError: Se a leitura falhar depois que registros já
+                foram entregues.
         """
+        delivered = 0
+        encoding = 'utf-8'
         try:
-            with open(self.file_path, newline='', encoding='utf-8') as f:
+            encoding = self._detect_encoding()
+            with open(
+                self.file_path,
+                newline='',
+                encoding=encoding,
+                buffering=READ_BUFFER_SIZE,
+            ) as f:
                 logger.debug(f'Lendo arquivo CSV: {self.file_path}')
-                return list(DictReader(f))
-        except UnicodeDecodeError:
-            try:
-                with open(self.file_path, newline='', encoding='cp1252') as f:
-                    logger.debug(
-                        f'Lendo com fallback cp1252: {self.file_path}'
-                    )
-                    return list(DictReader(f))
-            except Exception as e:
-                logger.error(f'Erro ao ler CSV com fallback cp1252: {e}')
+                for delivered, row in enumerate(self._parse_rows(f), start=1):
+                    yield row
         except FileNotFoundError:
             logger.error(f'Arquivo não encontrado: {self.file_path}')
         except Exception as e:
-            logger.error(f'Erro ao ler o CSV: {e}')
-        return []
+            if encoding == 'cp1252':
+                logger.error(f'Erro ao ler CSV com fallback cp1252: {e}')
+            else:
+                logger.error(f'Erro ao ler o CSV: {e}')
+            self._raise_if_partial(delivered, e)
+
+    def _detect_encoding(self) -> str:
+        """
+        Verifica se o arquivo inteiro é UTF-8 válido.
+
+        O arquivo é decodificado em blocos de ``READ_BUFFER_SIZE`` sem
+        manter o conteúdo em memória, de modo que a escolha do encoding
+        não depende de onde um bloco de decodificação termina.
+
+        Returns:
+            str: ``'utf-8'`` ou, se houver bytes inválidos, ``'cp1252'``.
+        """
+        try:
+            with open(
+                self.file_path,
+                newline='',
+                encoding='utf-8',
+                buffering=READ_BUFFER_SIZE,
+            ) as f:
+                while f.read(READ_BUFFER_SIZE):
+                    pass
+        except UnicodeDecodeError:
+            logger.debug(f'Lendo com fallback cp1252: {self.file_path}')
+            return 'cp1252'
+        return 'utf-8'
+
+    @staticmethod
+    def _raise_if_partial(delivered: int, error: Exception) -> None:
+        """
+        Interrompe a leitura se registros já tiverem sido entregues.
+
+        Args:
+            delivered (int): Quantidade de registros já entregues.
+            error (Exception): Erro que interrompeu a leitura.
+
+        Raises:
+            CSVReadError: Se ``delivered`` for maior que zero.
+        """
+        if delivered:
+            raise CSVReadError(
+                f'Leitura interrompida após {delivered} registros: {error}'
+            ) from error
+
+    @staticmethod
+    def _parse_rows(lines: Iterable[str]) -> Iterator[Dict[str, str]]:
+        """
+        Converte as linhas do CSV em dicionários sob demanda.
+
+        Usa ``csv.reader`` e monta cada registro com ``dict(zip(...))``
+        sobre o cabeçalho, evitando o custo por linha do ``DictReader``.
+        Linhas em branco são ignoradas e campos além do cabeçalho são
+        descartados.
+
+        Args:
+            lines (Iterable[str]): Linhas do arquivo CSV.
+
+        Returns:
+            Iterator[Dict[str, str]]: Registros do CSV.
+        """
+        rows = reader(lines)
+        header = next(rows, None)
+        if header is None:
+            return
+        for row in rows:
+            if row:
+                yield dict(zip(header, row))
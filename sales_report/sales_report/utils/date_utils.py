@@ -3,11 +3,15 @@ Utilitários para manipulação de datas.
 """
 
 from datetime import datetime
+from functools import lru_cache
 from logging import getLogger
 from typing import Optional
 
 logger = getLogger(__name__)
 
+# Tamanho de uma data no formato YYYY-MM-DD
+ISO_DATE_LENGTH = 10
+
 
 class DateUtils:
     """
@@ -22,6 +26,10 @@ class DateUtils:
         """
         Converte uma string de data no formato YYYY-MM-DD para datetime.
 
+        Usada para as datas informadas na linha de comando: tenta primeiro
+        o formato estrito de ``parse_iso_date`` e, se falhar, aceita também
+        mês e dia sem zero à esquerda (``2025-6-2``) via ``strptime``.
+
         Args:
             date_str (Optional[str]): String da data no formato YYYY-MM-DD
                 ou None.
@@ -33,6 +41,10 @@ class DateUtils:
         if not date_str:
             return None
 
+        date_obj = DateUtils.parse_iso_date(date_str)
+        if date_obj is not None:
+            return date_obj
+
         try:
             return datetime.strptime(date_str, '%Y-%m-%d')
         except ValueError as e:
@@ -40,3 +52,37 @@ class DateUtils:
                 f'Data inválida: "{date_str}". Esperado YYYY-MM-DD. Erro: {e}'
             )
             return None
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def parse_iso_date(date_str: str) -> Optional[datetime]:
+        """
+        Converte uma string estritamente no formato YYYY-MM-DD para datetime.
+
+        Usa ``datetime.fromisoformat``, implementado em C, em vez de
+        ``strptime``. Como ``fromisoformat`` aceita outras variantes ISO
+        (``20240601``, data com hora), uma verificação prévia do formato
+        mantém a exigência de YYYY-MM-DD e descarta entradas obviamente
+        inválidas sem lançar exceção.
+
+        Como dados de vendas repetem muito as mesmas datas, o resultado
+        (inclusive None) é memorizado por string e compartilhado entre o
+        filtro de data e o validador, que convertem cada data uma única vez.
+
+        Args:
+            date_str (str): String da data no formato YYYY-MM-DD.
+
+        Returns:
+            Optional[datetime]: Objeto datetime se a conversão estiver OK,
+                None caso contrário.
+        """
+        if (
+            len(date_str) != ISO_DATE_LENGTH
+            or date_str[4] != '-'
+            or date_str[7] != '-'
+        ):
+            return None
+        try:
+            return datetime.fromisoformat(date_str)
+        except ValueError:
+            return None
@@ -2,8 +2,9 @@
 Utilitários para detecção automática de schema de dados.
 """
 
+import re
 from logging import getLogger
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, FrozenSet, List, Optional, Set
 
 logger = getLogger(__name__)
 
@@ -22,11 +23,32 @@ class SchemaDetector:
     # Colunas opcionais conhecidas
     OPTIONAL_COLUMNS = {'data_venda'}
 
+    # Nomes conhecidos de coluna de data, em ordem de prioridade
+    DATE_COLUMN_CANDIDATES = (
+        'data_venda',
+        'data',
+        'date',
+        'data_pedido',
+        'data_compra',
+        'timestamp',
+        'created_at',
+    )
+
+    # Padrão para colunas cujo nome sugere uma data
+    DATE_COLUMN_PATTERN = re.compile(r'data|date', re.IGNORECASE)
+
+    # Schemas já detectados, indexados pelo conjunto de colunas
+    _cache: Dict[FrozenSet[str], Dict[str, Any]] = {}
+
     @classmethod
     def detect_schema(cls, data: List[Dict[str, str]]) -> Dict[str, Any]:
         """
         Detecta o schema dos dados baseado nas colunas presentes.
 
+        O schema depende apenas do conjunto de colunas do primeiro
+        registro, então o resultado é memorizado por esse conjunto e
+        reaproveitado quando arquivos com o mesmo formato são processados.
+
         Args:
             data (List[Dict[str, str]]): Lista de registros de dados.
 
@@ -41,18 +63,37 @@ class SchemaDetector:
             logger.warning('Nenhum dado fornecido para detecção de schema')
             return cls._empty_schema()
 
-        available_columns = set(data[0].keys()) if data else set()
+        fingerprint = frozenset(data[0])
+        schema_info = cls._cache.get(fingerprint)
+        if schema_info is None:
+            schema_info = cls._detect_from_columns(set(fingerprint))
+            cls._cache[fingerprint] = schema_info
+            logger.debug(f'Schema detectado: {schema_info}')
+        else:
+            logger.debug(f'Schema reaproveitado do cache: {schema_info}')
 
-        logger.info(
-            f'Colunas detectadas: {", ".join(sorted(available_columns))}'
-        )
+        cls._log_schema(schema_info)
 
-        missing_required = cls.REQUIRED_SALES_COLUMNS - available_columns
-        if missing_required:
-            logger.warning(
-                f'Colunas obrigatórias faltando: {", ".join(missing_required)}'
-            )
+        return {
+            **schema_info,
+            'available_columns': set(schema_info['available_columns']),
+            'required_columns': list(schema_info['required_columns']),
+        }
+
+    @classmethod
+    def _detect_from_columns(
+        cls, available_columns: Set[str]
+    ) -> Dict[str, Any]:
+        """
+        Monta as informações de schema a partir das colunas disponíveis.
+
+        Args:
+            available_columns (Set[str]): Set com colunas disponíveis.
 
+        Returns:
+            Dict[str, any]: Dicionário com informações do schema detectado.
+        """
+        missing_required = cls.REQUIRED_SALES_COLUMNS - available_columns
         date_column = cls._detect_date_column(available_columns)
         has_date_column = date_column is not None
 
@@ -68,41 +109,61 @@ class SchemaDetector:
             'is_valid_sales_data': len(missing_required) == 0,
         }
 
-        logger.debug(f'Schema detectado: {schema_info}')
         return schema_info
 
+    @classmethod
+    def _log_schema(cls, schema_info: Dict[str, Any]) -> None:
+        """
+        Registra os diagnósticos do schema detectado.
+
+        Chamado a cada detecção, inclusive quando o schema vem do cache,
+        para que colunas faltando continuem sendo reportadas.
+
+        Args:
+            schema_info (Dict[str, Any]): Informações do schema detectado.
+        """
+        available_columns = schema_info['available_columns']
+        logger.info(
+            f'Colunas detectadas: {", ".join(sorted(available_columns))}'
+        )
+
+        missing_required = cls.REQUIRED_SALES_COLUMNS - available_columns
+        if missing_required:
+            logger.warning(
+                f'Colunas obrigatórias faltando: {", ".join(missing_required)}'
+            )
+
+        date_column = schema_info['date_column']
+        if date_column is None:
+            logger.info('Nenhuma coluna de data detectada')
+        elif date_column in cls.DATE_COLUMN_CANDIDATES:
+            logger.info(f'Coluna de data detectada: {date_column}')
+        else:
+            logger.info(f'Possível coluna de data detectada: {date_column}')
+
     @classmethod
     def _detect_date_column(cls, columns: Set[str]) -> Optional[str]:
         """
         Detecta qual coluna contém dados de data.
 
+        Procura primeiro os nomes conhecidos, na ordem de prioridade, e
+        depois qualquer coluna cujo nome contenha "data" ou "date".
+
         Args:
             columns (Set[str]): Set com nomes das colunas disponíveis.
 
         Returns:
             Optional[str]: Nome da coluna de data ou None se não encontrada.
         """
-        date_column_candidates = {
-            'data_venda',
-            'data',
-            'date',
-            'data_pedido',
-            'data_compra',
-            'timestamp',
-            'created_at',
-        }
-
-        for candidate in date_column_candidates:
+        for candidate in cls.DATE_COLUMN_CANDIDATES:
             if candidate in columns:
-                logger.info(f'Coluna de data detectada: {candidate}')
                 return candidate
 
+        search = cls.DATE_COLUMN_PATTERN.search
         for column in columns:
-            if 'data' in column.lower() or 'date' in column.lower():
-                logger.info(f'Possível coluna de data detectada: {column}')
+            if search(column):
                 return column
 
-        logger.info('Nenhuma coluna de data detectada')
         return None
 
     @classmethod
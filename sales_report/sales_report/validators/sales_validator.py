@@ -2,11 +2,11 @@
 Implementação de validadores para dados de vendas.
 """
 
-from datetime import datetime
 from logging import getLogger
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
 
 from sales_report.interfaces.data_validator import DataValidator
+from sales_report.utils.date_utils import DateUtils
 
 logger = getLogger(__name__)
 
@@ -47,13 +47,34 @@ class SalesDataValidator(DataValidator):
             self.date_column = None
 
     def validate(
-        self, data: List[Dict[str, str]]
+        self, data: Iterable[Dict[str, str]]
     ) -> Tuple[List[Dict[str, str]], List[str]]:
         """
         Valida os dados de vendas.
 
         Args:
-            data (List[Dict[str, str]]): Lista de registros a serem validados.
+            data (Iterable[Dict[str, str]]): Registros a serem validados,
+                percorridos uma única vez.
+
+        Returns:
+            Tuple[List[Dict[str, str]], List[str]]: Tupla contendo
+                lista de registros válidos e lista de mensagens de erro.
+        """
+        return self.validate_numbered(enumerate(data, start=1))
+
+    def validate_numbered(
+        self, numbered_rows: Iterable[Tuple[int, Dict[str, str]]]
+    ) -> Tuple[List[Dict[str, str]], List[str]]:
+        """
+        Valida registros numerados pela posição no arquivo de origem.
+
+        As mensagens "Linha N" usam o número recebido, de modo que erros em
+        registros que passaram pelos filtros apontam para a linha original
+        (1 = primeiro registro de dados).
+
+        Args:
+            numbered_rows (Iterable[Tuple[int, Dict[str, str]]]): Pares
+                (número da linha, registro), percorridos uma única vez.
 
         Returns:
             Tuple[List[Dict[str, str]], List[str]]: Tupla contendo
@@ -62,7 +83,7 @@ class SalesDataValidator(DataValidator):
         valid_data: List[Dict[str, str]] = []
         errors: List[str] = []
 
-        for idx, row in enumerate(data, start=1):
+        for idx, row in numbered_rows:
             row_errors = self._validate_row(row, idx)
 
             if row_errors:
@@ -140,8 +161,4 @@ class SalesDataValidator(DataValidator):
         Returns:
             bool: True se a data estiver em formato válido.
         """
-        try:
-            datetime.strptime(date_str, '%Y-%m-%d')
-            return True
-        except ValueError:
-            return False
+        return DateUtils.parse_iso_date(date_str) is not None
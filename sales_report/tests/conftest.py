@@ -1,7 +1,11 @@
+from unittest.mock import MagicMock
+
 import pytest
 
+from sales_report.interfaces.data_reader import DataReader
 
-@pytest.fixture
+
+@pytest.fixture(scope='session')
 def mock_csv_data():
     return (
         'produto,quantidade,preco_unitario,data_venda\n'
@@ -10,7 +14,7 @@ def mock_csv_data():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def mock_csv_data_no_date():
     """CSV sem coluna de data."""
     return 'produto,quantidade,preco_unitario\nCamiseta,3,49.9\nCalça,2,99.9\n'
@@ -117,3 +121,15 @@ def sample_schema_no_date():
         'date_column': None,
         'is_valid_sales_data': True,
     }
+
+
+@pytest.fixture
+def make_reader():
+    """Cria leitores simulados que retornam os registros informados."""
+
+    def _make_reader(rows):
+        reader = MagicMock(spec=DataReader)
+        reader.read.return_value = rows
+        return reader
+
+    return _make_reader
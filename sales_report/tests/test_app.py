@@ -11,9 +11,14 @@ from sales_report.factories.formatter_factory import FormatterFactory
 from sales_report.filters.date_filter import DateFilter
 from sales_report.formatters.json_formatter import JSONFormatter
 from sales_report.formatters.text_formatter import TextFormatter
+from sales_report.interfaces.data_filter import DataFilter
 from sales_report.main import main
 from sales_report.processors.sales_processor import SalesDataProcessor
-from sales_report.readers.csv_reader import CSVReader
+from sales_report.readers.csv_reader import (
+    READ_BUFFER_SIZE,
+    CSVReader,
+    CSVReadError,
+)
 from sales_report.utils.date_utils import DateUtils
 from sales_report.utils.schema_detector import SchemaDetector
 from sales_report.validators.sales_validator import (
@@ -25,6 +30,17 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 
+def _utf8_fails_then(fallback_open):
+    """Simula open() que falha em UTF-8 e delega as demais tentativas."""
+
+    def open_side_effect(*args, **kwargs):
+        if kwargs.get('encoding') == 'utf-8':
+            raise UnicodeDecodeError('utf-8', b'', 0, 1, 'reason')
+        return fallback_open(*args, **kwargs)
+
+    return open_side_effect
+
+
 class TestCSVReader:
     """Testes para a classe CSVReader."""
 
@@ -34,15 +50,31 @@ class TestCSVReader:
         m = mock_open(read_data=mock_csv_data)
         with patch('builtins.open', m):
             reader = CSVReader('fake.csv')
-            result = reader.read()
+            result = list(reader.read())
             assert result == parsed_rows
+            assert m.call_args.kwargs['buffering'] == READ_BUFFER_SIZE
+
+    @staticmethod
+    def test_read_skips_blank_lines(mock_csv_data, parsed_rows):
+        """Testa que linhas em branco do CSV são ignoradas."""
+        m = mock_open(read_data=mock_csv_data.replace('\n', '\n\n', 1))
+        with patch('builtins.open', m):
+            result = list(CSVReader('fake.csv').read())
+        assert result == parsed_rows
+
+    @staticmethod
+    def test_read_empty_file():
+        """Testa leitura de arquivo vazio."""
+        with patch('builtins.open', mock_open(read_data='')):
+            result = list(CSVReader('fake.csv').read())
+        assert result == []
 
     @staticmethod
     def test_read_file_not_found(caplog):
         """Testa comportamento quando arquivo não é encontrado."""
         reader = CSVReader('nofile.csv')
         with caplog.at_level('ERROR'):
-            result = reader.read()
+            result = list(reader.read())
         assert result == []
         assert 'Arquivo não encontrado' in caplog.text
 
@@ -56,25 +88,19 @@ class TestCSVReader:
         with patch('builtins.open', raise_err):
             reader = CSVReader('fake.csv')
             with caplog.at_level('ERROR'):
-                result = reader.read()
+                result = list(reader.read())
             assert result == []
             assert 'Erro ao ler o CSV' in caplog.text
 
     @staticmethod
-    def test_read_fallback_cp1252_success(mock_csv_data, parsed_rows, caplog):
+    def test_read_fallback_cp1252_success(mock_csv_data, parsed_rows):
         """Testa fallback bem-sucedido para CP1252."""
         m = mock_open(read_data=mock_csv_data)
-
-        def open_side_effect(*args, **kwargs):
-            if kwargs.get('encoding') == 'utf-8':
-                raise UnicodeDecodeError('utf-8', b'', 0, 1, 'reason')
-            else:
-                return m()
+        open_side_effect = _utf8_fails_then(lambda *args, **kwargs: m())
 
         with patch('builtins.open', side_effect=open_side_effect):
             reader = CSVReader('file.csv')
-            with caplog.at_level('INFO'):
-                result = reader.read()
+            result = list(reader.read())
 
             assert result == parsed_rows
 
@@ -82,20 +108,69 @@ class TestCSVReader:
     def test_read_fallback_cp1252_logs_error(caplog):
         """Testa log de erro quando fallback CP1252 falha."""
 
-        def open_side_effect(*args, **kwargs):
-            if kwargs.get('encoding') == 'utf-8':
-                raise UnicodeDecodeError('utf-8', b'', 0, 1, 'reason')
-            else:
-                raise RuntimeError('fail cp1252')
+        def fail_cp1252(*args, **kwargs):
+            raise RuntimeError('fail cp1252')
+
+        open_side_effect = _utf8_fails_then(fail_cp1252)
 
         with patch('builtins.open', side_effect=open_side_effect):
             reader = CSVReader('file.csv')
             with caplog.at_level('ERROR'):
-                result = reader.read()
+                result = list(reader.read())
 
             assert result == []
             assert 'Erro ao ler CSV com fallback cp1252' in caplog.text
 
+    @staticmethod
+    def test_read_fallback_cp1252_mid_file_keeps_rows_once(tmp_path):
+        """Testa fallback CP1252 no meio do arquivo sem duplicar linhas."""
+        rows_expected = 2000
+        lines = ['produto,quantidade,preco_unitario']
+        lines += [f'Camiseta,{i},10.00' for i in range(1, rows_expected)]
+        lines.append('Calçado,1,10.00')
+        csv_file = tmp_path / 'mixed.csv'
+        csv_file.write_bytes('\n'.join(lines).encode('cp1252'))
+
+        result = list(CSVReader(str(csv_file)).read())
+
+        assert len(result) == rows_expected
+        assert result[-1]['produto'] == 'Calçado'
+        assert [row['quantidade'] for row in result[:-1]] == [
+            str(i) for i in range(1, rows_expected)
+        ]
+
+    @staticmethod
+    def test_read_decodes_whole_file_with_one_encoding(tmp_path):
+        """Testa que bytes iguais não mudam de produto no meio do arquivo."""
+        rows_utf8 = 3000
+        header = 'produto,quantidade,preco_unitario\n'.encode('utf-8')
+        body = 'Calça,1,10.00\n'.encode('utf-8') * rows_utf8
+        tail = 'Calça,1,10.00\n'.encode('cp1252')
+        csv_file = tmp_path / 'mixed.csv'
+        csv_file.write_bytes(header + body + tail)
+
+        products = [row['produto'] for row in CSVReader(str(csv_file)).read()]
+
+        assert products.count('CalÃ§a') == rows_utf8
+        assert products[-1] == 'Calça'
+        assert len(products) == rows_utf8 + 1
+
+    @staticmethod
+    def test_read_fails_when_both_encodings_break_mid_file(tmp_path, caplog):
+        """Testa que a leitura falha se o erro vier após registros lidos."""
+        csv_file = tmp_path / 'broken.csv'
+        lines = ['produto,quantidade,preco_unitario']
+        lines += ['Camiseta,1,10.00'] * 3000
+        csv_file.write_bytes('\n'.join(lines).encode('utf-8') + b'\n\x81')
+
+        with (
+            caplog.at_level('ERROR'),
+            pytest.raises(CSVReadError, match='Leitura interrompida'),
+        ):
+            list(CSVReader(str(csv_file)).read())
+
+        assert 'Erro ao ler CSV com fallback cp1252' in caplog.text
+
 
 class TestSchemaDetector:
     """Testes para o detector de schema."""
@@ -122,6 +197,31 @@ class TestSchemaDetector:
         assert schema['is_valid_sales_data'] is True
         assert 'produto' in schema['available_columns']
 
+    @staticmethod
+    def test_detect_schema_cache_returns_copies(parsed_rows):
+        """Testa que o schema em cache não é afetado por mutações."""
+        first = SchemaDetector.detect_schema(parsed_rows)
+        first['available_columns'].clear()
+        first['required_columns'].clear()
+
+        second = SchemaDetector.detect_schema(parsed_rows)
+
+        assert 'produto' in second['available_columns']
+        assert 'data_venda' in second['required_columns']
+
+    @staticmethod
+    def test_detect_schema_cache_hit_keeps_diagnostics(caplog):
+        """Testa que o schema em cache continua reportando colunas."""
+        data = [{'produto': 'A', 'quantidade': '1'}]
+        SchemaDetector.detect_schema(data)
+        caplog.clear()
+
+        with caplog.at_level('INFO'):
+            SchemaDetector.detect_schema(data)
+
+        assert 'Colunas obrigatórias faltando: preco_unitario' in caplog.text
+        assert 'Nenhuma coluna de data detectada' in caplog.text
+
     @staticmethod
     def test_detect_schema_empty_data():
         """Testa detecção com dados vazios."""
@@ -151,6 +251,13 @@ class TestSchemaDetector:
         detected = SchemaDetector._detect_date_column(columns)
         assert detected == 'data_venda_errada'
 
+    @staticmethod
+    def test_detect_date_column_prefers_known_names_in_order():
+        """Testa prioridade entre nomes conhecidos e busca sem caixa."""
+        columns = {'Data_Entrega', 'created_at', 'data_pedido'}
+        assert SchemaDetector._detect_date_column(columns) == 'data_pedido'
+        assert SchemaDetector._detect_date_column({'DATE_X'}) == 'DATE_X'
+
     @staticmethod
     def test_detect_schema_with_partial_date_column():
         """Testa detecção de schema com coluna de data contendo substring."""
@@ -205,9 +312,16 @@ class TestSalesDataValidator:
         assert len(errors) == 0
 
     @staticmethod
-    def test_validate_invalid_rows(
-        invalid_rows, sample_schema_with_date, caplog
-    ):
+    def test_validate_consumes_iterator(parsed_rows, sample_schema_with_date):
+        """Testa validação de registros produzidos sob demanda."""
+        validator = SalesDataValidator(schema_info=sample_schema_with_date)
+        valid_data, errors = validator.validate(iter(parsed_rows))
+
+        assert valid_data == parsed_rows
+        assert errors == []
+
+    @staticmethod
+    def test_validate_invalid_rows(invalid_rows, sample_schema_with_date):
         """Testa validação com dados inválidos."""
         validator = SalesDataValidator(schema_info=sample_schema_with_date)
         valid_data, errors = validator.validate(invalid_rows)
@@ -242,6 +356,13 @@ class TestSalesDataValidator:
         assert len(valid_data) == 0
         assert any('formato inválido' in error for error in errors)
 
+    @staticmethod
+    def test_is_valid_date_format_requires_zero_padding():
+        """Testa que datas sem zero à esquerda são rejeitadas."""
+        assert SalesDataValidator._is_valid_date_format('2025-06-01')
+        assert not SalesDataValidator._is_valid_date_format('2025-6-1')
+        assert not SalesDataValidator._is_valid_date_format('2025-02-30')
+
 
 class TestDateFilter:
     """Testes para o filtro de data."""
@@ -258,6 +379,22 @@ class TestDateFilter:
         assert len(filtered_data) == 1
         assert filtered_data[0]['produto'] == 'Camiseta'
 
+    @staticmethod
+    def test_configure_binds_detected_date_column(sample_schema_with_date):
+        """Testa que configure associa o filtro à coluna detectada."""
+        date_filter = DateFilter(
+            start_date=datetime(2025, 6, 1), date_column='outra'
+        )
+        schema = {**sample_schema_with_date, 'date_column': 'data_pedido'}
+
+        assert date_filter.configure(schema) is True
+        assert date_filter.date_column == 'data_pedido'
+
+    @staticmethod
+    def test_configure_skips_filter_without_bounds(sample_schema_with_date):
+        """Testa que um filtro sem datas limite é ignorado."""
+        assert DateFilter().configure(sample_schema_with_date) is False
+
     @staticmethod
     def test_filter_no_date_column(parsed_rows_no_date, caplog):
         """Testa filtro quando não há coluna de data."""
@@ -283,6 +420,61 @@ class TestDateFilter:
         assert len(filtered_data) == 0
         assert 'Data ignorada por formato inválido' in caplog.text
 
+    @staticmethod
+    def test_filter_rejects_compact_iso_date(caplog):
+        """Testa que datas ISO sem separador (YYYYMMDD) são rejeitadas."""
+        data = [
+            {
+                'produto': 'p1',
+                'quantidade': '1',
+                'preco_unitario': '10.0',
+                'data_venda': '20240601',
+            },
+        ]
+        date_filter = DateFilter(datetime(2024, 1, 1), datetime(2024, 12, 31))
+
+        with caplog.at_level('WARNING'):
+            filtered_data = date_filter.filter(data)
+
+        assert filtered_data == []
+        assert 'Data ignorada por formato inválido' in caplog.text
+
+    @staticmethod
+    def test_filter_impossible_date(caplog):
+        """Testa filtro com data no formato correto, mas inexistente."""
+        data = [
+            {
+                'produto': 'p1',
+                'quantidade': '1',
+                'preco_unitario': '10.0',
+                'data_venda': '2024-13-01',
+            },
+        ]
+        date_filter = DateFilter(datetime(2024, 1, 1))
+
+        with caplog.at_level('WARNING'):
+            filtered_data = date_filter.filter(data)
+
+        assert filtered_data == []
+        assert 'formato inválido: "2024-13-01"' in caplog.text
+
+    @staticmethod
+    def test_filter_reports_each_invalid_date_once(caplog):
+        """Testa que datas inválidas repetidas geram um único aviso."""
+        row = {
+            'produto': 'p1',
+            'quantidade': '1',
+            'preco_unitario': '10.0',
+            'data_venda': 'N/A',
+        }
+        date_filter = DateFilter(datetime(2024, 1, 1))
+
+        with caplog.at_level('WARNING'):
+            filtered_data = date_filter.filter([row, dict(row), dict(row)])
+
+        assert filtered_data == []
+        assert caplog.text.count('Data ignorada por formato inválido') == 1
+
     @staticmethod
     def test_filter_no_dates_specified(parsed_rows):
         """Testa filtro quando nenhuma data é especificada."""
@@ -336,6 +528,51 @@ class TestSalesDataProcessor:
         assert 'produto_mais_vendido' in result
         assert result['total_vendas'] > 0
 
+    @staticmethod
+    def test_process_accumulates_repeated_products():
+        """Testa acumulação de vendas de um mesmo produto em várias linhas."""
+        data = [
+            {'produto': 'Camiseta', 'quantidade': '3', 'preco_unitario': '10'},
+            {'produto': 'Calça', 'quantidade': '4', 'preco_unitario': '50'},
+            {'produto': 'Camiseta', 'quantidade': '2', 'preco_unitario': '10'},
+        ]
+        result = SalesDataProcessor().process(data)
+
+        assert list(result['vendas_por_produto'].items()) == [
+            ('Calça', 200.0),
+            ('Camiseta', 50.0),
+        ]
+        value_expected = 250.0
+        assert result['total_vendas'] == value_expected
+        assert result['produto_mais_vendido'] == {
+            'nome': 'Camiseta',
+            'quantidade': 5,
+        }
+
+    @staticmethod
+    def test_process_top_product_tie_keeps_first_read():
+        """Testa desempate: vence o primeiro produto lido."""
+        data = [
+            {'produto': 'A', 'quantidade': '1', 'preco_unitario': '10'},
+            {'produto': 'B', 'quantidade': '5', 'preco_unitario': '10'},
+            {'produto': 'A', 'quantidade': '4', 'preco_unitario': '10'},
+        ]
+        result = SalesDataProcessor().process(data)
+
+        assert result['produto_mais_vendido'] == {'nome': 'A', 'quantidade': 5}
+
+    @staticmethod
+    def test_process_top_product_uses_final_totals():
+        """Testa produto mais vendido com quantidade negativa."""
+        data = [
+            {'produto': 'A', 'quantidade': '5', 'preco_unitario': '10'},
+            {'produto': 'A', 'quantidade': '-4', 'preco_unitario': '10'},
+            {'produto': 'B', 'quantidade': '3', 'preco_unitario': '10'},
+        ]
+        result = SalesDataProcessor().process(data)
+
+        assert result['produto_mais_vendido'] == {'nome': 'B', 'quantidade': 3}
+
     @staticmethod
     def test_process_empty_data():
         """Testa processamento de dados vazios."""
@@ -373,6 +610,34 @@ class TestFormatters:
         ):
             FormatterFactory.create_formatter(invalid_type)
 
+    @staticmethod
+    def test_create_formatter_reuses_instance():
+        """Testa que a factory reutiliza a instância de cada formatador."""
+        formatter = FormatterFactory.create_formatter('json')
+
+        assert isinstance(formatter, JSONFormatter)
+        assert FormatterFactory.create_formatter('json') is formatter
+
+    @staticmethod
+    def test_register_formatter(monkeypatch):
+        """Testa registro de um novo formatador na factory."""
+        monkeypatch.setattr(
+            FormatterFactory, '_formatters', {**FormatterFactory._formatters}
+        )
+        monkeypatch.setattr(FormatterFactory, '_instances', {})
+
+        class UpperFormatter(TextFormatter):
+            pass
+
+        FormatterFactory.create_formatter('text')
+        FormatterFactory.register('text', UpperFormatter)
+        FormatterFactory.register('upper', UpperFormatter)
+
+        assert isinstance(
+            FormatterFactory.create_formatter('text'), UpperFormatter
+        )
+        assert 'upper' in FormatterFactory.get_available_formats()
+
     @staticmethod
     def test_text_formatter():
         """Testa formatador de texto."""
@@ -389,6 +654,40 @@ class TestFormatters:
         assert 'Camiseta' in result
         assert 'R$ 349.50' in result
 
+    @staticmethod
+    def test_text_formatter_table_layout():
+        """Testa o alinhamento das colunas da tabela de vendas."""
+        data = {
+            'vendas_por_produto': {'Camiseta': 149.7, 'Calça': 1999.8},
+            'total_vendas': 2149.5,
+            'produto_mais_vendido': {'nome': 'Camiseta', 'quantidade': 3},
+        }
+
+        lines = TextFormatter().format(data).splitlines()
+
+        assert lines[1:5] == [
+            'Produto      Total (R$)',
+            '---------  ------------',
+            'Camiseta         149.70',
+            'Calça           1999.80',
+        ]
+
+    @staticmethod
+    def test_text_formatter_keeps_numeric_names_as_text():
+        """Testa que nomes numéricos ficam alinhados à esquerda."""
+        data = {
+            'vendas_por_produto': {'123': 10.0, 'nan': 5.0},
+            'total_vendas': 15.0,
+            'produto_mais_vendido': {'nome': '123', 'quantidade': 1},
+        }
+
+        lines = TextFormatter().format(data).splitlines()
+
+        assert lines[3:5] == [
+            '123               10.00',
+            'nan                5.00',
+        ]
+
     @staticmethod
     def test_json_formatter():
         """Testa formatador JSON."""
@@ -434,6 +733,38 @@ class TestDateUtils:
         assert result is None
         assert 'Data inválida' in caplog.text
 
+    @staticmethod
+    @pytest.mark.parametrize('date_str', ['20250601', '2025-06-01T10:00'])
+    def test_parse_date_rejects_other_iso_variants(date_str, caplog):
+        """Testa que variantes ISO fora de YYYY-MM-DD são rejeitadas."""
+        with caplog.at_level('ERROR'):
+            result = DateUtils.parse_date(date_str)
+
+        assert result is None
+        assert 'Data inválida' in caplog.text
+
+    @staticmethod
+    def test_parse_date_accepts_unpadded_date():
+        """Testa que a data da linha de comando aceita mês sem zero."""
+        assert DateUtils.parse_date('2025-6-2') == datetime(2025, 6, 2)
+        assert DateUtils.parse_iso_date('2025-6-2') is None
+
+    @staticmethod
+    def test_parse_iso_date_shared_between_validator_and_filter(
+        parsed_rows, sample_schema_with_date
+    ):
+        """Testa que filtro e validador convertem cada data uma vez."""
+        DateUtils.parse_iso_date.cache_clear()
+        date_filter = DateFilter(start_date=datetime(2025, 6, 1))
+        validator = SalesDataValidator(schema_info=sample_schema_with_date)
+
+        valid_data, _ = validator.validate(date_filter.filter(parsed_rows))
+
+        assert valid_data
+        assert DateUtils.parse_iso_date.cache_info().misses == len({
+            row['data_venda'] for row in parsed_rows
+        })
+
     @staticmethod
     def test_parse_date_none():
         """Testa parsing com valor None."""
@@ -441,9 +772,8 @@ class TestDateUtils:
         assert result is None
 
     @staticmethod
-    def test_date_filter_ignored_log(parsed_rows, caplog):
-        mock_reader = MagicMock()
-        mock_reader.read.return_value = parsed_rows
+    def test_date_filter_ignored_log(parsed_rows, caplog, make_reader):
+        mock_reader = make_reader(parsed_rows)
 
         date_filter = DateFilter()
 
@@ -474,10 +804,9 @@ class TestSalesAnalyzerApp:
     """Testes para a aplicação principal."""
 
     @staticmethod
-    def test_run_success(parsed_rows, capsys):
+    def test_run_success(parsed_rows, make_reader):
         """Testa execução bem-sucedida da aplicação."""
-        mock_reader = MagicMock()
-        mock_reader.read.return_value = parsed_rows
+        mock_reader = make_reader(parsed_rows)
 
         processor = SalesDataProcessor()
         formatter = TextFormatter()
@@ -496,10 +825,46 @@ class TestSalesAnalyzerApp:
         assert 'Camiseta' in result
 
     @staticmethod
-    def test_run_no_data(caplog):
+    def test_run_streams_reader_rows(parsed_rows, make_reader):
+        """Testa execução com leitor que produz registros sob demanda."""
+        mock_reader = make_reader(iter(parsed_rows))
+
+        app = SalesAnalyzerApp(
+            data_reader=mock_reader,
+            data_processor=SalesDataProcessor(),
+            output_formatter=JSONFormatter(),
+            data_filters=[DateFilter(start_date=datetime(2025, 6, 1))],
+        )
+
+        result = json.loads(app.run())
+
+        assert result == SalesDataProcessor().process(parsed_rows)
+
+    @staticmethod
+    def test_run_with_supplied_schema(
+        parsed_rows, sample_schema_with_date, make_reader
+    ):
+        """Testa execução com schema fornecido, sem detecção."""
+        mock_reader = make_reader(parsed_rows)
+
+        app = SalesAnalyzerApp(
+            data_reader=mock_reader,
+            data_processor=SalesDataProcessor(),
+            output_formatter=JSONFormatter(),
+            data_validator=SalesDataValidator(),
+            schema_info=sample_schema_with_date,
+        )
+
+        with patch.object(SchemaDetector, 'detect_schema') as detect:
+            result = json.loads(app.run())
+
+        detect.assert_not_called()
+        assert result == SalesDataProcessor().process(parsed_rows)
+
+    @staticmethod
+    def test_run_no_data(make_reader):
         """Testa execução sem dados."""
-        mock_reader = MagicMock()
-        mock_reader.read.return_value = []
+        mock_reader = make_reader([])
 
         processor = SalesDataProcessor()
         formatter = TextFormatter()
@@ -515,12 +880,11 @@ class TestSalesAnalyzerApp:
         assert 'Nenhum dado disponível para processar' in result
 
     @staticmethod
-    def test_run_invalid_schema():
+    def test_run_invalid_schema(make_reader):
         """Testa execução com schema inválido."""
         invalid_data = [{'nome': 'João', 'idade': '30'}]
 
-        mock_reader = MagicMock()
-        mock_reader.read.return_value = invalid_data
+        mock_reader = make_reader(invalid_data)
 
         processor = SalesDataProcessor()
         formatter = TextFormatter()
@@ -536,10 +900,9 @@ class TestSalesAnalyzerApp:
         assert 'colunas mínimas necessárias' in result
 
     @staticmethod
-    def test_run_with_date_filter(parsed_rows):
+    def test_run_with_date_filter(parsed_rows, make_reader):
         """Testa execução com filtro de data."""
-        mock_reader = MagicMock()
-        mock_reader.read.return_value = parsed_rows
+        mock_reader = make_reader(parsed_rows)
 
         processor = SalesDataProcessor()
         formatter = TextFormatter()
@@ -560,10 +923,75 @@ class TestSalesAnalyzerApp:
         assert 'Camiseta' in result
 
     @staticmethod
-    def test_run_json_output(parsed_rows):
+    def test_run_filters_before_validation(parsed_rows, caplog, make_reader):
+        """Testa que registros fora do filtro não chegam à validação."""
+        rows = [
+            *parsed_rows,
+            {
+                'produto': 'Boné',
+                'quantidade': 'abc',
+                'preco_unitario': '10',
+                'data_venda': '2025-07-01',
+            },
+        ]
+        mock_reader = make_reader(rows)
+
+        app = SalesAnalyzerApp(
+            data_reader=mock_reader,
+            data_processor=SalesDataProcessor(),
+            output_formatter=TextFormatter(),
+            data_validator=SalesDataValidator(),
+            data_filters=[DateFilter(end_date=datetime(2025, 6, 30))],
+        )
+
+        with caplog.at_level('WARNING'):
+            result = app.run()
+
+        assert 'Camiseta' in result
+        assert 'Quantidade deve ser um número inteiro' not in caplog.text
+
+    @staticmethod
+    def test_run_reports_original_line_after_filter(caplog, make_reader):
+        """Testa que erros citam a linha original mesmo após filtros."""
+        mock_reader = make_reader([
+            {
+                'produto': 'Antigo',
+                'quantidade': '1',
+                'preco_unitario': '10',
+                'data_venda': '2024-01-01',
+            },
+            {
+                'produto': 'Camiseta',
+                'quantidade': '2',
+                'preco_unitario': '10',
+                'data_venda': '2025-06-01',
+            },
+            {
+                'produto': 'Boné',
+                'quantidade': 'x',
+                'preco_unitario': '10',
+                'data_venda': '2025-06-02',
+            },
+        ])
+
+        app = SalesAnalyzerApp(
+            data_reader=mock_reader,
+            data_processor=SalesDataProcessor(),
+            output_formatter=TextFormatter(),
+            data_validator=SalesDataValidator(),
+            data_filters=[DateFilter(start_date=datetime(2025, 1, 1))],
+        )
+
+        with caplog.at_level('WARNING'):
+            result = app.run()
+
+        assert 'Camiseta' in result
+        assert 'Linha 3: Quantidade deve ser um número inteiro' in caplog.text
+
+    @staticmethod
+    def test_run_json_output(parsed_rows, make_reader):
         """Testa execução com saída JSON."""
-        mock_reader = MagicMock()
-        mock_reader.read.return_value = parsed_rows
+        mock_reader = make_reader(parsed_rows)
 
         processor = SalesDataProcessor()
         formatter = JSONFormatter()
@@ -581,16 +1009,15 @@ class TestSalesAnalyzerApp:
         assert 'total_vendas' in data
 
     @staticmethod
-    def test_run_with_invalid_data_and_custom_validator():
+    def test_run_with_invalid_data_and_custom_validator(make_reader):
         """Testa execução com validador customizado sem has_date_column."""
-        mock_reader = MagicMock()
-        mock_reader.read.return_value = [
+        mock_reader = make_reader([
             {
                 'produto': 'Camiseta',
                 'quantidade': 'abc',
                 'preco_unitario': '10',
             }
-        ]
+        ])
 
         class DummyValidator(DataValidator):
             @staticmethod
@@ -612,12 +1039,27 @@ class TestSalesAnalyzerApp:
         assert 'Erro: Nenhum dado válido encontrado após validação.' in result
 
     @staticmethod
-    def test_run_with_non_date_filter(parsed_rows):
+    def test_validate_numbered_default_delegates_to_validate(parsed_rows):
+        """Testa que a numeração é descartada pela implementação padrão."""
+
+        class PassThroughValidator(DataValidator):
+            @staticmethod
+            def validate(data):
+                return list(data), []
+
+        numbered = list(enumerate(parsed_rows, start=1))
+
+        valid_data, errors = PassThroughValidator().validate_numbered(numbered)
+
+        assert valid_data == parsed_rows
+        assert errors == []
+
+    @staticmethod
+    def test_run_with_non_date_filter(parsed_rows, make_reader):
         """Testa execução com filtro que não depende de coluna de data."""
-        mock_reader = MagicMock()
-        mock_reader.read.return_value = parsed_rows
+        mock_reader = make_reader(parsed_rows)
 
-        class DummyFilter:
+        class DummyFilter(DataFilter):
             @staticmethod
             def filter(data):
                 return data
@@ -629,21 +1071,98 @@ class TestSalesAnalyzerApp:
             data_reader=mock_reader,
             data_processor=processor,
             output_formatter=formatter,
-            data_filters=[DummyFilter()],  # type: ignore
+            data_filters=[DummyFilter()],
         )
 
         result = app.run()
         assert 'Total de vendas por produto:' in result
 
     @staticmethod
-    def test_run_filters_result_empty(parsed_rows):
-        """Testa execução onde filtros removem todos os dados."""
-        mock_reader = MagicMock()
-        mock_reader.read.return_value = parsed_rows
+    def test_run_combines_filter_predicates(parsed_rows, make_reader):
+        """Testa combinação de vários filtros em uma única passada."""
+        mock_reader = make_reader(parsed_rows)
+
+        class ExcludeCalcaFilter(DataFilter):
+            @staticmethod
+            def filter(data):
+                return [row for row in data if row['produto'] != 'Calça']
+
+        app = SalesAnalyzerApp(
+            data_reader=mock_reader,
+            data_processor=SalesDataProcessor(),
+            output_formatter=JSONFormatter(),
+            data_filters=[
+                DateFilter(start_date=datetime(2025, 6, 1)),
+                DateFilter(end_date=datetime(2025, 6, 30)),
+                ExcludeCalcaFilter(),
+            ],
+        )
+
+        result = json.loads(app.run())
+
+        assert list(result['vendas_por_produto']) == ['Camiseta']
+
+    @staticmethod
+    def test_run_boundless_date_filter_skips_list_path(
+        parsed_rows, make_reader
+    ):
+        """Testa que um filtro de data sem limites não bufferiza o fluxo."""
+        app = SalesAnalyzerApp(
+            data_reader=make_reader(parsed_rows),
+            data_processor=SalesDataProcessor(),
+            output_formatter=JSONFormatter(),
+            data_filters=[DateFilter()],
+        )
 
-        class AlwaysExcludeFilter:
-            date_column = 'data_venda'
+        with patch.object(SalesAnalyzerApp, '_apply_list_filter') as spy:
+            result = json.loads(app.run())
 
+        spy.assert_not_called()
+        assert list(result['vendas_por_produto']) == ['Calça', 'Camiseta']
+
+    @staticmethod
+    def test_run_applies_filters_in_configured_order(make_reader):
+        """Testa que predicados rodam antes de filtros posteriores."""
+        mock_reader = make_reader([
+            {
+                'produto': 'Old',
+                'quantidade': '1',
+                'preco_unitario': '10',
+                'data_venda': '2024-01-01',
+            },
+            {
+                'produto': 'New',
+                'quantidade': '1',
+                'preco_unitario': '10',
+                'data_venda': '2025-06-01',
+            },
+        ])
+
+        class FirstOnly(DataFilter):
+            @staticmethod
+            def filter(data):
+                return data[:1]
+
+        app = SalesAnalyzerApp(
+            data_reader=mock_reader,
+            data_processor=SalesDataProcessor(),
+            output_formatter=JSONFormatter(),
+            data_filters=[
+                DateFilter(start_date=datetime(2025, 1, 1)),
+                FirstOnly(),
+            ],
+        )
+
+        result = json.loads(app.run())
+
+        assert list(result['vendas_por_produto']) == ['New']
+
+    @staticmethod
+    def test_run_filters_result_empty(parsed_rows, make_reader):
+        """Testa execução onde filtros removem todos os dados."""
+        mock_reader = make_reader(parsed_rows)
+
+        class AlwaysExcludeFilter(DataFilter):
             @staticmethod
             def filter(data):
                 return []
@@ -655,7 +1174,7 @@ class TestSalesAnalyzerApp:
             data_reader=mock_reader,
             data_processor=processor,
             output_formatter=formatter,
-            data_filters=[AlwaysExcludeFilter()],  # type: ignore
+            data_filters=[AlwaysExcludeFilter()],
         )
 
         result = app.run()
@@ -682,6 +1201,23 @@ class TestMainFunction:
             assert 'Total de vendas por produto:' in captured.out
             assert 'Produto mais vendido' in captured.out
 
+    @staticmethod
+    def test_main_reports_read_failure_after_rows(tmp_path, capsys, caplog):
+        """Testa que main não imprime total truncado se a leitura falha."""
+        csv_file = tmp_path / 'broken.csv'
+        lines = ['produto,quantidade,preco_unitario']
+        lines += ['Camiseta,1,10.00'] * 3000
+        csv_file.write_bytes('\n'.join(lines).encode('utf-8') + b'\n\x81')
+
+        with (
+            patch.object(sys, 'argv', ['program', str(csv_file)]),
+            caplog.at_level('ERROR'),
+        ):
+            main()
+
+        assert not capsys.readouterr().out
+        assert 'Erro na execução da aplicação' in caplog.text
+
     @staticmethod
     def test_main_with_date_filter(mock_csv_data, parsed_rows, capsys):
         """Testa função main com filtro de data."""
@@ -3,14 +3,22 @@ Testes de integração para o sistema completo.
 """
 
 import json
-import os
 import sys
-import tempfile
-from unittest.mock import patch
+from unittest.mock import mock_open, patch
 
 from sales_report.main import main
 
 
+def _run_main_with_csv(csv_content, *argv_extra):
+    """Executa main() lendo o CSV da memória em vez do disco."""
+    test_argv = ['program', 'dados.csv', *argv_extra]
+    with (
+        patch('builtins.open', mock_open(read_data=csv_content)),
+        patch.object(sys, 'argv', test_argv),
+    ):
+        main()
+
+
 class TestIntegration:
     """Testes de integração do sistema completo."""
 
@@ -22,24 +30,13 @@ Camiseta,3,49.9,2025-06-01
 Calça,2,99.9,2025-06-05
 Tênis,1,199.9,2025-06-03"""
 
-        with tempfile.NamedTemporaryFile(
-            mode='w', suffix='.csv', delete=False, encoding='utf-8'
-        ) as f:
-            f.write(csv_content)
-            csv_path = f.name
-
-        try:
-            test_argv = ['program', csv_path]
-            with patch.object(sys, 'argv', test_argv):
-                main()
-
-            captured = capsys.readouterr()
-            assert 'Total de vendas por produto:' in captured.out
-            assert 'Camiseta' in captured.out
-            assert 'Calça' in captured.out
-            assert 'Tênis' in captured.out
-        finally:
-            os.unlink(csv_path)
+        _run_main_with_csv(csv_content)
+
+        captured = capsys.readouterr()
+        assert 'Total de vendas por produto:' in captured.out
+        assert 'Camiseta' in captured.out
+        assert 'Calça' in captured.out
+        assert 'Tênis' in captured.out
 
     @staticmethod
     def test_integration_csv_without_date(capsys):
@@ -49,22 +46,11 @@ Camiseta,3,49.9
 Calça,2,99.9
 Tênis,1,199.9"""
 
-        with tempfile.NamedTemporaryFile(
-            mode='w', suffix='.csv', delete=False, encoding='utf-8'
-        ) as f:
-            f.write(csv_content)
-            csv_path = f.name
+        _run_main_with_csv(csv_content)
 
-        try:
-            test_argv = ['program', csv_path]
-            with patch.object(sys, 'argv', test_argv):
-                main()
-
-            captured = capsys.readouterr()
-            assert 'Total de vendas por produto:' in captured.out
-            assert 'Camiseta' in captured.out
-        finally:
-            os.unlink(csv_path)
+        captured = capsys.readouterr()
+        assert 'Total de vendas por produto:' in captured.out
+        assert 'Camiseta' in captured.out
 
     @staticmethod
     def test_integration_with_date_filter(capsys):
@@ -74,30 +60,31 @@ Camiseta,3,49.9,2025-06-01
 Calça,2,99.9,2025-06-05
 Tênis,1,199.9,2025-06-03"""
 
-        with tempfile.NamedTemporaryFile(
-            mode='w', suffix='.csv', delete=False, encoding='utf-8'
-        ) as f:
-            f.write(csv_content)
-            csv_path = f.name
-
-        try:
-            test_argv = [
-                'program',
-                csv_path,
-                '--start-date',
-                '2025-06-01',
-                '--end-date',
-                '2025-06-03',
-            ]
-            with patch.object(sys, 'argv', test_argv):
-                main()
-
-            captured = capsys.readouterr()
-            assert 'Camiseta' in captured.out
-            assert 'Tênis' in captured.out
-            assert captured.out.count('Calça') == 0
-        finally:
-            os.unlink(csv_path)
+        _run_main_with_csv(
+            csv_content,
+            '--start-date',
+            '2025-06-01',
+            '--end-date',
+            '2025-06-03',
+        )
+
+        captured = capsys.readouterr()
+        assert 'Camiseta' in captured.out
+        assert 'Tênis' in captured.out
+        assert 'Calça' not in captured.out
+
+    @staticmethod
+    def test_integration_date_filter_accepts_unpadded_date(capsys):
+        """Testa filtro de data informado sem zero à esquerda."""
+        csv_content = """produto,quantidade,preco_unitario,data_venda
+Camiseta,3,49.9,2025-06-01
+Calça,2,99.9,2025-06-05"""
+
+        _run_main_with_csv(csv_content, '--start-date', '2025-6-2')
+
+        captured = capsys.readouterr()
+        assert 'Calça' in captured.out
+        assert 'Camiseta' not in captured.out
 
     @staticmethod
     def test_integration_json_output(capsys):
@@ -105,21 +92,10 @@ Tênis,1,199.9,2025-06-03"""
         csv_content = """produto,quantidade,preco_unitario
 Camiseta,3,49.9"""
 
-        with tempfile.NamedTemporaryFile(
-            mode='w', suffix='.csv', delete=False, encoding='utf-8'
-        ) as f:
-            f.write(csv_content)
-            csv_path = f.name
-
-        try:
-            test_argv = ['program', csv_path, '--format', 'json']
-            with patch.object(sys, 'argv', test_argv):
-                main()
+        _run_main_with_csv(csv_content, '--format', 'json')
 
-            captured = capsys.readouterr()
+        captured = capsys.readouterr()
 
-            data = json.loads(captured.out)
-            assert 'vendas_por_produto' in data
-            assert 'Camiseta' in data['vendas_por_produto']
-        finally:
-            os.unlink(csv_path)
+        data = json.loads(captured.out)
+        assert 'vendas_por_produto' in data
+        assert 'Camiseta' in data['vendas_por_produto']